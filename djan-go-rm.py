@@ -2,11 +2,18 @@
 
 import os
 import argparse
+import filecmp
+import functools
+import hashlib
+import multiprocessing
 import pathlib
+import posixpath
 import shutil
 import subprocess
+import sys
 import json
-from typing import List, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Mapping, Optional, Tuple
 
 import jinja2
 from django.apps import AppConfig, apps
@@ -28,32 +35,100 @@ GO_NULLDATETIME = "sql.NullTime"
 GO_STRING = "string"
 GO_NULLSTRING = "sql.NullString"
 
+# Go null type and its value member for each nullable Go type
 GO_NULLTYPES = {
-    GO_BOOL: GO_NULLBOOL,
-    GO_INT64: GO_NULLINT64,
-    GO_INT32: GO_NULLINT32,
-    GO_FLOAT64: GO_NULLFLOAT64,
-    GO_DATETIME: GO_NULLDATETIME,
-    GO_STRING: GO_NULLSTRING,
+    GO_BOOL: (GO_NULLBOOL, 'Bool'),
+    GO_INT64: (GO_NULLINT64, 'Int64'),
+    GO_INT32: (GO_NULLINT32, 'Int32'),
+    GO_FLOAT64: (GO_NULLFLOAT64, 'Float64'),
+    GO_DATETIME: (GO_NULLDATETIME, 'Time'),
+    GO_STRING: (GO_NULLSTRING, 'String'),
 }
 
-GO_NULLTYPES_VALUES = {
-    GO_BOOL: 'Bool',
-    GO_INT64: 'Int64',
-    GO_INT32: 'Int32',
-    GO_FLOAT64: 'Float64',
-    GO_DATETIME: 'Time',
-    GO_STRING: 'String',
-}
+# Basic Django field types and their Go counterparts, checked in order
+_BASIC_TYPES = (
+    ((fields.BooleanField, fields.NullBooleanField), GO_BOOL),
+    ((fields.BigIntegerField, fields.BigAutoField), GO_INT64),
+    ((fields.SmallIntegerField, fields.IntegerField, fields.AutoField), GO_INT32),
+    (fields.FloatField, GO_FLOAT64),
+    ((fields.DateField, fields.DateTimeField, fields.TimeField), GO_DATETIME),
+)
+
+# Go type resolved for each Django field class seen so far
+_BASIC_TYPE_MAP = {}
+
+# Comparison filters generated for non-relational fields, as (method suffix, SQL operator, description)
+_EQUALITY_OPS = (
+    ('Eq', '=', 'equal to'),
+    ('Ne', '<>', 'not equal to'),
+)
+
+# Comparison filters generated additionally for non-bool fields
+_ORDERING_OPS = (
+    ('Lt', '<', 'less than'),
+    ('Le', '<=', 'less than or equal to'),
+    ('Gt', '>', 'greater than'),
+    ('Ge', '>=', 'greater than or equal to'),
+)
+
+# Kinds of Django fields, as far as _get_type is concerned
+KIND_AUTO64 = 'auto64'
+KIND_AUTO32 = 'auto32'
+KIND_FK = 'fk'
+KIND_REV = 'rev'
+KIND_M2M = 'm2m'
+KIND_SCALAR = 'scalar'
+
+# Django field classes and their kinds, checked in order
+_FIELD_KINDS = (
+    (fields.BigAutoField, KIND_AUTO64),
+    (fields.AutoField, KIND_AUTO32),
+    (models.ForeignKey, KIND_FK),
+    (models.ManyToOneRel, KIND_REV),
+    ((models.ManyToManyField, models.ManyToManyRel), KIND_M2M),
+)
+
+# Kind resolved for each Django field class seen so far
+_FIELD_KIND_MAP = {}
+
 
+def _resolve_by_class(f, table, cache, default):
+    """ Resolve f against an ordered (classes, value) table
 
+    The first isinstance() match wins. Results are memoized per class in cache.
+    """
+    value = cache.get(type(f))
+    if value is None:
+        value = default
+        for classes, v in table:
+            if isinstance(f, classes):
+                value = v
+                break
+
+        cache[type(f)] = value
+
+    return value
+
+
+@functools.lru_cache(maxsize=None)
 def to_camelcase(word):
-    return ''.join(x.capitalize() or '_' for x in word.split('_'))
+    # single segment names, like id or name, need no splitting
+    if '_' not in word:
+        return sys.intern(word.capitalize() or '_')
+
+    return sys.intern(''.join([x.capitalize() or '_' for x in word.split('_')]))
 
 
 class Field:
     """ Field encapsulates a Django Model field """
 
+    __slots__ = (
+        'model', 'field', 'origrawtype', 'rawtype', 'goname', 'pubname', 'gotype', 'rawmember',
+        'getter', 'relmodel', 'related_model_goname', 'related_model_qsname', 'reverse', '_public', 'null', 'nullvalue', 'autofield', 'choices',
+        'db_column', 'db_column_quoted',
+        'frag_eq', 'filter_ops', 'frag_isnull', 'frag_isnotnull', 'frag_in_prefix', 'frag_notin_prefix', 'frag_order_desc',
+    )
+
     def __init__(self, m: 'Model', f: fields.Field):
         self.model = m
         self.field = f
@@ -80,6 +155,10 @@ class Field:
         # if relmodel is defined too, then getter will return that model instead
         self.relmodel: 'Model' = None
 
+        # Go names of relmodel and its queryset, qualified with the package if in another app
+        self.related_model_goname: str = None
+        self.related_model_qsname: str = None
+
         # if reverse is defined, then the field is virtual, a reverse relation is in place
         # and a queryset will be returned
         self.reverse = False
@@ -96,24 +175,21 @@ class Field:
         # Is this field an autofield
         self.autofield: bool = False
 
-    @property
-    def db_column(self):
-        _, column = self.field.get_attname_column()
-        return column
-
-    @property
-    def related_model_goname(self):
-        if self.model.app == self.relmodel.app:
-            return self.relmodel.goname
-
-        return "{}.{}".format(self.relmodel.app.label, self.relmodel.goname)
+        # (value, Go literal) pairs for fields with choices
+        self.choices = None
 
-    @property
-    def related_model_qsname(self):
-        if self.model.app == self.relmodel.app:
-            return self.relmodel.qsname
+        # Database column, resolved in setup() for concrete fields
+        self.db_column: str = None
+        self.db_column_quoted: str = None
 
-        return "{}.{}".format(self.relmodel.app.label, self.relmodel.qsname)
+        # SQL fragments for filters and ordering, built in setup() from db_column_quoted
+        self.frag_eq: str = None
+        self.filter_ops: List[Tuple[str, str, str]] = None
+        self.frag_isnull: str = None
+        self.frag_isnotnull: str = None
+        self.frag_in_prefix: str = None
+        self.frag_notin_prefix: str = None
+        self.frag_order_desc: str = None
 
     @property
     def remote_field(self) -> 'Field':
@@ -124,46 +200,47 @@ class Field:
 
     def _get_type(self):
         f = self.field
+        kind = _resolve_by_class(f, _FIELD_KINDS, _FIELD_KIND_MAP, KIND_SCALAR)
 
         # Autofields are read-only
-        if isinstance(f, fields.BigAutoField):
+        if kind == KIND_AUTO64 or kind == KIND_AUTO32:
             self._public = False
-            self.getter = "Get{}".format(self.goname)
+            self.getter = sys.intern(f"Get{self.goname}")
             self.autofield = True
-            return GO_INT64
+            return GO_INT64 if kind == KIND_AUTO64 else GO_INT32
 
-        if isinstance(f, fields.AutoField):
-            self._public = False
-            self.getter = "Get{}".format(self.goname)
-            self.autofield = True
-            return GO_INT32
+        # many-to-many relations not supported
+        if kind == KIND_M2M:
+            return None
 
-        if isinstance(f, (models.ForeignKey, models.ManyToOneRel)):
+        if kind == KIND_FK or kind == KIND_REV:
             mm: Options = f.related_model._meta
             app = self.model.get_app(mm.app_label)
             if app.generate:
-                self.relmodel = self.model.get_app(mm.app_label).get_model(mm.model_name)
+                self.relmodel = relmodel = app.get_model(mm.model_name)
+                if app == self.model.app:
+                    self.related_model_goname = relmodel.goname
+                    self.related_model_qsname = relmodel.qsname
+                else:
+                    self.related_model_goname = f"{app.label}.{relmodel.goname}"
+                    self.related_model_qsname = f"{app.label}.{relmodel.qsname}"
                 self._public = False
-                if isinstance(f, models.ForeignKey):
-                    self.getter = "Get{}Raw".format(self.goname)
-                else:  # models.ManyToOneRel
+                if kind == KIND_REV:
                     if app == self.model.app:
                         self.getter = self.goname
                         self.reverse = True
                     return None
 
+                self.getter = sys.intern(f"Get{self.goname}Raw")
+
                 if app != self.model.app:
-                    self.model.model_packages.add(app.gomodule)
+                    self.model.model_packages.setdefault(app.gomodule)
 
-            if isinstance(f, models.ManyToOneRel):
+            if kind == KIND_REV:
                 return None
 
             f = mm.pk
 
-        # many-to-many relations not supported
-        if isinstance(f, (models.ManyToManyField, models.ManyToManyRel)):
-            return None
-
         # Array support for basic types
         arrayprefix = ''
         while isinstance(f, pgfields.ArrayField):
@@ -173,19 +250,12 @@ class Field:
         return arrayprefix + self._get_type_basic(f)
 
     def _get_type_basic(self, f):
-        if isinstance(f, (fields.BooleanField, fields.NullBooleanField)):
-            return GO_BOOL
-        if isinstance(f, (fields.BigIntegerField, fields.BigAutoField)):
-            return GO_INT64
-        if isinstance(f, (fields.SmallIntegerField, fields.IntegerField, fields.AutoField)):
-            return GO_INT32
-        if isinstance(f, fields.FloatField):
-            return GO_FLOAT64
-        if isinstance(f, (fields.DateField, fields.DateTimeField, fields.TimeField)):
-            self.model.core_packages.add("time")
-            return GO_DATETIME
-
-        return GO_STRING
+        gotype = _resolve_by_class(f, _BASIC_TYPES, _BASIC_TYPE_MAP, GO_STRING)
+
+        if gotype == GO_DATETIME:
+            self.model.core_packages.setdefault("time")
+
+        return gotype
 
     def setup(self):
         if self.goname.lower() == 'id':
@@ -197,18 +267,35 @@ class Field:
         if self.rawtype is None:
             return
 
+        _, self.db_column = self.field.get_attname_column()
+        self.db_column_quoted = col = f'"{self.db_column}"'
+
+        self.frag_eq = col + ' ='
+        self.frag_isnull = col + ' IS NULL'
+        self.frag_isnotnull = col + ' IS NOT NULL'
+        self.frag_in_prefix = col + ' IN ('
+        self.frag_notin_prefix = col + ' NOT IN ('
+        self.frag_order_desc = col + ' DESC'
+
         # convert fields with choices to Go types
         if self.field.choices:
             self.origrawtype = self.rawtype
 
-            self.rawtype = '{}_{}'.format(self.model.goname, self.pubname)
+            self.rawtype = f'{self.model.goname}_{self.pubname}'
 
             self.choices = map(lambda x: (x[0], json.dumps(x[0])), self.field.choices)
 
+        # (method suffix, SQL fragment, description) for comparison filters
+        ops = _EQUALITY_OPS if self.rawtype == GO_BOOL else _EQUALITY_OPS + _ORDERING_OPS
+        self.filter_ops = [(name, f'{col} {op}', desc) for name, op, desc in ops]
+
+        if self.null:
+            nulltype, nullvalue = GO_NULLTYPES.get(self.rawtype, (self.rawtype, None))
+
         if self.gotype is None:
             if self.null:
-                self.model.core_packages.add("database/sql")
-                self.gotype = GO_NULLTYPES.get(self.rawtype, self.rawtype)
+                self.model.core_packages.setdefault("database/sql")
+                self.gotype = nulltype
             else:
                 self.gotype = self.rawtype
 
@@ -216,17 +303,17 @@ class Field:
             if self.goname.lower() == 'id':
                 self.goname = 'id'
             else:
-                self.goname = self.goname[:1].lower() + self.goname[1:]
+                self.goname = sys.intern(self.goname[:1].lower() + self.goname[1:])
 
         if self.rawmember is None:
             if self.null:
-                self.rawmember = '{}.{}'.format(self.goname, GO_NULLTYPES_VALUES.get(self.rawtype, None))
+                self.rawmember = sys.intern(f'{self.goname}.{nullvalue}')
             else:
                 self.rawmember = self.goname
 
         if self.null:
             if self.nullvalue is None:
-                self.nullvalue = GO_NULLTYPES_VALUES.get(self.rawtype, None)
+                self.nullvalue = nullvalue
 
 
 _model_template = """
@@ -242,19 +329,7 @@ _model_template = """
 
 package {{ model.app.label }}
 
-import (
-{% for p in model.core_packages %}
-    {{ p | string -}}
-{% endfor %}
-
-{% for p in model.external_packages %}
-    {{ p | string -}}
-{% endfor %}
-
-{% for p in model.model_packages %}
-    {{ p | string -}}
-{% endfor %}
-)
+{{ model.imports_block }}
 
 {% for f in model.fields %}
 {% if f.origrawtype %}
@@ -363,7 +438,7 @@ func (qs {{ model.qsname }}) {{ field.pubname }}IsNull() {{ model.qsname }} {
     qs.condFragments = append(
         qs.condFragments,
         &models.ConstantFragment{
-            Constant: `{{ field.db_column | string }} IS NULL`,
+            Constant: `{{ field.frag_isnull }}`,
         },
     )
     return qs
@@ -374,7 +449,7 @@ func (qs {{ model.qsname }}) {{ field.pubname }}IsNotNull() {{ model.qsname }} {
     qs.condFragments = append(
         qs.condFragments,
         &models.ConstantFragment{
-            Constant: `{{ field.db_column | string }} IS NOT NULL`,
+            Constant: `{{ field.frag_isnotnull }}`,
         },
     )
     return qs
@@ -385,12 +460,12 @@ func (qs {{ model.qsname }}) {{ field.pubname }}IsNotNull() {{ model.qsname }} {
 {%- if field.relmodel -%}
 // {{ field.pubname }}Eq filters for {{ field.goname }} being equal to argument
 func (qs {{ model.qsname }}) {{ field.pubname }}Eq(v *{{ field.related_model_goname }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} =`, v.{{ field.relmodel.pkvalue }})
+    return qs.filter(`{{ field.frag_eq }}`, v.{{ field.relmodel.pkvalue }})
 }
 
 // {{ field.pubname }}RawEq filters for {{ field.goname }} being equal to raw argument
 func (qs {{ model.qsname }}) {{ field.pubname }}RawEq(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} =`, v)
+    return qs.filter(`{{ field.frag_eq }}`, v)
 }
 
 type in{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }} struct {
@@ -400,7 +475,7 @@ type in{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }} struct {
 func (in *in{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }}) GetConditionFragment(c *models.PositionalCounter) (string, []interface{}) {
     s, p := in.qs.QueryId(c)
 
-    return `{{ field.db_column | string }} IN (` + s + `)`, p
+    return `{{ field.frag_in_prefix }}` + s + `)`, p
 }
 
 
@@ -420,9 +495,9 @@ type notin{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }} struct
 }
 
 func (nin *notin{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }}) GetConditionFragment(c *models.PositionalCounter) (string, []interface{}) {
-    s, p := in.qs.QueryId(c)
+    s, p := nin.qs.QueryId(c)
 
-    return `{{ field.db_column | string }} NOT IN (` + s + `)`, p
+    return `{{ field.frag_notin_prefix }}` + s + `)`, p
 }
 
 
@@ -439,37 +514,12 @@ func (qs {{ model.qsname }}) {{ field.pubname }}NotIn(oqs {{ field.related_model
 
 
 {% else -%}
-// {{ field.pubname }}Eq filters for {{ field.goname }} being equal to argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Eq(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} =`, v)
-}
-
-// {{ field.pubname }}Ne filters for {{ field.goname }} being not equal to argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Ne(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} <>`, v)
-}
-
-{% if field.rawtype != "bool" %}
-// {{ field.pubname }}Lt filters for {{ field.goname }} being less than argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Lt(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} <`, v)
+{% for name, frag, desc in field.filter_ops %}
+// {{ field.pubname }}{{ name }} filters for {{ field.goname }} being {{ desc }} argument
+func (qs {{ model.qsname }}) {{ field.pubname }}{{ name }}(v {{ field.rawtype }}) {{ model.qsname }} {
+    return qs.filter(`{{ frag }}`, v)
 }
-
-// {{ field.pubname }}Le filters for {{ field.goname }} being less than or equal to argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Le(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} <=`, v)
-}
-
-// {{ field.pubname }}Gt filters for {{ field.goname }} being greater than argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Gt(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} >`, v)
-}
-
-// {{ field.pubname }}Ge filters for {{ field.goname }} being greater than or equal to argument
-func (qs {{ model.qsname }}) {{ field.pubname }}Ge(v {{ field.rawtype }}) {{ model.qsname }} {
-    return qs.filter(`{{ field.db_column | string }} >=`, v)
-}
-{% endif %}
+{% endfor %}
 
 type in{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }} []interface{}
 
@@ -478,18 +528,18 @@ func (in in{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }}) GetC
         return `false`, nil
     }
 
-    var params []string
-    for range in {
-        params = append(params, c.Get())
+    params := make([]string, len(in))
+    for i := range in {
+        params[i] = c.Get()
     }
 
-    return `{{ field.db_column | string }} IN (` + strings.Join(params, ", ") + `)`, in
+    return `{{ field.frag_in_prefix }}` + strings.Join(params, ", ") + `)`, in
 }
 
 func (qs {{ model.qsname }}) {{ field.pubname }}In(values []{{ field.rawtype }}) {{ model.qsname }} {
-    var vals []interface{}
-    for _, v := range values {
-        vals = append(vals, v)
+    vals := make([]interface{}, len(values))
+    for i, v := range values {
+        vals[i] = v
     }
 
     qs.condFragments = append(
@@ -507,18 +557,18 @@ func (in notin{{ model.goname }}{{ field.goname }}{{ field.relmodel.goname }}) G
         return `false`, nil
     }
 
-    var params []string
-    for range in {
-        params = append(params, c.Get())
+    params := make([]string, len(in))
+    for i := range in {
+        params[i] = c.Get()
     }
 
-    return `{{ field.db_column | string }} NOT IN (` + strings.Join(params, ", ") + `)`, in
+    return `{{ field.frag_notin_prefix }}` + strings.Join(params, ", ") + `)`, in
 }
 
 func (qs {{ model.qsname }}) {{ field.pubname }}NotIn(values []{{ field.rawtype }}) {{ model.qsname }} {
-    var vals []interface{}
-    for _, v := range values {
-        vals = append(vals, v)
+    vals := make([]interface{}, len(values))
+    for i, v := range values {
+        vals[i] = v
     }
 
     qs.condFragments = append(
@@ -533,21 +583,21 @@ func (qs {{ model.qsname }}) {{ field.pubname }}NotIn(values []{{ field.rawtype
 
 // OrderBy{{ field.pubname }} sorts result by {{ field.pubname }} in ascending order
 func (qs {{ model.qsname }}) OrderBy{{ field.pubname }}() {{ model.qsname }} {
-    qs.order = append(qs.order, `{{ field.db_column | string }}`)
+    qs.order = append(qs.order, `{{ field.db_column_quoted }}`)
 
     return qs
 }
 
 // OrderBy{{ field.pubname }}Desc sorts result by {{ field.pubname }} in descending order
 func (qs {{ model.qsname }}) OrderBy{{ field.pubname }}Desc() {{ model.qsname }} {
-    qs.order = append(qs.order, `{{ field.db_column | string }} DESC`)
+    qs.order = append(qs.order, `{{ field.frag_order_desc }}`)
 
     return qs
 }
 
 // DistinctOn{{ field.pubname }} marks field in queries to add to DISTINCT ON clause
 func (qs {{ model.qsname }})DistinctOn{{ field.pubname }}() {{ model.qsname }} {
-    qs.distinctOnFields = append(qs.distinctOnFields, `{{ field.db_column | string }}`)
+    qs.distinctOnFields = append(qs.distinctOnFields, `{{ field.db_column_quoted }}`)
 
     return qs
 }
@@ -641,7 +691,7 @@ func (qs {{ model.qsname }}) Count(ctx context.Context, db models.DBInterface) (
     if len(qs.distinctOnFields) > 0 {
         countClause = fmt.Sprintf("DISTINCT (%s)", strings.Join(qs.distinctOnFields, ", "))
     } else {
-        countClause = `"{{ model.pk.db_column }}"`
+        countClause = `{{ model.pk.db_column_quoted }}`
     }
 
     row := db.QueryRow(ctx, `SELECT COUNT(` + countClause + `) FROM "{{ model.db_table }}"` + s, p...)
@@ -749,17 +799,17 @@ func (uqs {{ model.uqsname }}) update(c string, v interface{}) {{ model.uqsname
 // Set{{ field.pubname }} sets foreign key pointer to {{ field.related_model_goname }}
 func (uqs {{ model.uqsname }}) Set{{ field.pubname }}(ptr *{{ field.related_model_goname }}) {{ model.uqsname }} {
     if ptr != nil {
-        return uqs.update(`{{ field.db_column | string }}`, ptr.{{ field.relmodel.pkvalue }})
+        return uqs.update(`{{ field.db_column_quoted }}`, ptr.{{ field.relmodel.pkvalue }})
     }
 
-    return uqs.update(`{{ field.db_column | string }}`, nil)
+    return uqs.update(`{{ field.db_column_quoted }}`, nil)
 }
 
 {%- else -%}
 
 // Set{{ field.pubname }} sets {{ field.pubname }} to the given value
 func (uqs {{ model.uqsname }}) Set{{ field.pubname }}(v {{ field.gotype }}) {{ model.uqsname }} {
-    return uqs.update(`{{ field.db_column | string }}`, v)
+    return uqs.update(`{{ field.db_column_quoted }}`, v)
 }
 
 {% endif -%}
@@ -776,7 +826,7 @@ func (uqs {{ model.uqsname }}) Exec(ctx context.Context, db models.DBInterface)
 
     var params []interface{}
 
-    var sets []string
+    sets := make([]string, 0, len(uqs.updates))
     for _, set := range uqs.updates {
         s, p := set.GetConditionFragment(c)
 
@@ -844,6 +894,31 @@ func ({{ receiver }} *{{ model.goname }}) Delete(ctx context.Context, db models.
     return err
 }
 
+// valuesClause returns positional parameter markers for inserting all elements in one statement
+func ({{ receiver }}l {{ model.goname }}List) valuesClause() string {
+    var b strings.Builder
+
+    offs := 1
+    for i := range {{ receiver }}l {
+        if i > 0 {
+            b.WriteString(", ")
+        }
+
+        b.WriteByte('(')
+        for j := 0; j < {{ insert_stmt_column_count }}; j++ {
+            if j > 0 {
+                b.WriteString(", ")
+            }
+            b.WriteByte('$')
+            b.WriteString(strconv.Itoa(offs))
+            offs++
+        }
+        b.WriteByte(')')
+    }
+
+    return b.String()
+}
+
 // Save saves all elements, optimizing inserts in a batch
 func ({{ receiver }}l {{ model.goname }}List)Save(ctx context.Context, db models.DBInterface) error {
     var inserts {{ model.goname }}List
@@ -862,16 +937,12 @@ func ({{ receiver }}l {{ model.goname }}List)Save(ctx context.Context, db models
         return nil
     }
 
-    vva := make([]string, 0, len(inserts))
     vaa := make([]any, 0, {{ insert_stmt_column_count }} * len(inserts))
-    offs := 1
     for _, {{ receiver }} := range inserts {
-        vva = append(vva, {{ insert_stmt_values_template }})
         vaa = append(vaa, {{ insert_members }})
-        offs += {{ insert_stmt_column_count }}
     }
 
-    qs := `{{ batch_insert_stmt}} ` + strings.Join(vva, ", "){%- if model.auto_fields %} + ` {{ batch_insert_returning }}`{% endif %}
+    qs := `{{ batch_insert_stmt}} ` + inserts.valuesClause(){%- if model.auto_fields %} + ` {{ batch_insert_returning }}`{% endif %}
 
 {%- if model.auto_fields %}
     rows, err := db.Query(ctx, qs, vaa...)
@@ -917,31 +988,96 @@ func ({{ receiver }} *{{ model.goname }}) {{ field.getter }}() {{ field.related_
 
 """
 
+# Generated files start with this, followed by hashes of the rendered source and of the formatted body
+_SIGNATURE_PREFIX = '// djan-go-rm sig: '
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _signature_line(source_digest: str, body: bytes) -> bytes:
+    """ First line of a generated file, body being the formatted source following it """
+    return f'{_SIGNATURE_PREFIX}{source_digest} {_digest(body)}\n'.encode('ascii')
+
+
+def _replace_file(path: pathlib.Path, data: bytes):
+    """ Replace contents of path atomically, through a temporary file in the same directory """
+    tmp = path.with_name(f'.{path.name}.tmp')
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """ Cache compiled template bytecode in the system temporary directory across runs """
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({'model.go': _model_template}),
+    bytecode_cache=_bytecode_cache(),
+    auto_reload=False,
+)
+
+# Compiled once per process, shared by all models
+_MODEL_TEMPLATE = _ENV.get_template('model.go')
+
 
 class Model:
     """ Model encapsulates a Django model """
 
+    __slots__ = (
+        'app', 'model', 'model_name', 'label', 'db_table', 'gofspath',
+        'core_packages', 'external_packages', 'model_packages', 'imports_block',
+        'goname', 'qsname', 'uqsname',
+        'fields', '_fields_by_raw_name', 'concrete_fields', 'user_fields', 'auto_fields', 'reverse_fields',
+        'pk', 'pkvalue', 'select_column_list',
+        '_quoted_concrete_cols', '_quoted_user_cols', '_quoted_auto_cols', '_concrete_goname_ptrs',
+        'receiver', 'select_member_ptrs', 'select_id_stmt', 'batch_insert_stmt', 'insert_stmt',
+        'insert_stmt_column_count', 'batch_insert_returning', 'insert_members', 'insert_autoptr_members',
+        'update_stmt', 'update_members', 'delete_stmt', 'update_qs_stmt', 'delete_qs_stmt',
+    )
+
     def __init__(self, app: 'Application', m: models.Model):
         self.app = app
         self.model = m
 
-        # referenced packages
-        self.core_packages = {"context", "fmt", "strings"}
-        self.external_packages = {"github.com/jackc/pgx/v5"}
-        self.model_packages = {os.path.join(args.gomodule, 'models')}
+        # Django model metadata
+        options: Options = m._meta
+        self.model_name: str = options.model_name
+        self.label: str = options.label
+        self.db_table: str = options.db_table
+
+        # Generated Go source file
+        self.gofspath: pathlib.Path = app.gofspath / f'{self.model_name}.go'
+
+        # referenced packages, dicts are used as insertion-ordered sets
+        self.core_packages = dict.fromkeys(("context", "fmt", "strconv", "strings"))
+        self.external_packages = dict.fromkeys(("github.com/jackc/pgx/v5",))
+        self.model_packages = dict.fromkeys((app.apps.models_import_path,))
 
         # This is the Go struct name
         self.goname = to_camelcase(self.model_name)
 
         # Queryset name for the Model
-        self.qsname = "{}QS".format(self.goname)
+        self.qsname = sys.intern(f"{self.goname}QS")
 
         # Update queryset name for the Model
-        self.uqsname = "{}UpdateQS".format(self.goname)
+        self.uqsname = sys.intern(f"{self.goname}UpdateQS")
 
         # All fields for the model
         self.fields: List[Field] = []
 
+        # fields indexed by their Django name
+        self._fields_by_raw_name: Mapping[str, Field] = dict()
+
         # Concrete fields, i.e. which need a struct member
         self.concrete_fields: List[Field] = []
 
@@ -954,6 +1090,9 @@ class Model:
         # Reverse fields
         self.reverse_fields: List[Field] = []
 
+        # Go import declaration, built once all referenced packages are known
+        self.imports_block: str = None
+
         # PK field
         self.pk: Field = None
 
@@ -963,49 +1102,64 @@ class Model:
         # escaped column-list for selects
         self.select_column_list: str = None
 
-    @property
-    def gofspath(self) -> pathlib.Path:
-        return pathlib.Path(os.path.join(self.app.gofspath, '{}.go'.format(self.model_name)))
-
-    @property
-    def model_name(self):
-        return self.model._meta.model_name
-
-    @property
-    def label(self):
-        return self.model._meta.label
-
-    @property
-    def db_table(self):
-        return self.model._meta.db_table
+        # quoted column names, in the order of concrete_fields/user_fields/auto_fields
+        self._quoted_concrete_cols: List[str] = []
+        self._quoted_user_cols: List[str] = []
+        self._quoted_auto_cols: List[str] = []
+
+        # scan targets for select, in the order of concrete_fields
+        self._concrete_goname_ptrs: List[str] = []
+
+        # Receiver name of generated methods
+        self.receiver: str = None
+
+        # SQL statements and their Go argument lists, built in setup()
+        self.select_member_ptrs: str = None
+        self.select_id_stmt: str = None
+        self.batch_insert_stmt: str = None
+        self.insert_stmt: str = None
+        self.insert_stmt_column_count: int = 0
+        self.batch_insert_returning: str = None
+        self.insert_members: str = None
+        self.insert_autoptr_members: str = None
+        self.update_stmt: str = None
+        self.update_members: str = None
+        self.delete_stmt: str = None
+        self.update_qs_stmt: str = None
+        self.delete_qs_stmt: str = None
 
     def get_field_by_raw_name(self, name: str) -> Field:
-        for f in self.fields:
-            if f.field.name == name:
-                return f
-
-        return None
+        return self._fields_by_raw_name.get(name)
 
     def setup(self):
         """ Setup model """
 
         options: Options = self.model._meta
 
+        # bound once, used for every field
+        add_reverse = self.reverse_fields.append
+        add_field = self.fields.append
+        add_concrete = self.concrete_fields.append
+        add_auto = self.auto_fields.append
+        add_user = self.user_fields.append
+        fields_by_raw_name = self._fields_by_raw_name
+
         for f in options.get_fields():
             field = Field(self, f)
             field.setup()
 
             if field.reverse:
-                self.reverse_fields.append(field)
+                add_reverse(field)
                 continue
 
             # Skip not supported fields (e.g. unknown type, non-concrete)
             if field.rawtype is None:
                 continue
 
-            self.fields.append(field)
+            add_field(field)
+            fields_by_raw_name[f.name] = field
 
-            self.concrete_fields.append(field)
+            add_concrete(field)
 
             is_pkey = getattr(f, 'primary_key', False)
             if is_pkey:
@@ -1014,102 +1168,121 @@ class Model:
                 self.pk = field
 
             if field.autofield:
-                self.auto_fields.append(field)
+                add_auto(field)
             elif not is_pkey:
-                self.user_fields.append(field)
+                add_user(field)
 
         if self.pk:
             if self.pkvalue is None:
                 if self.pk.getter:
-                    self.pkvalue = '{}()'.format(self.pk.getter)
+                    self.pkvalue = f'{self.pk.getter}()'
                 else:
                     self.pkvalue = self.pk.goname
 
-    def get_app(self, label: str) -> 'Application':
-        return self.app.get_app(label)
+        self._quoted_concrete_cols = [f.db_column_quoted for f in self.concrete_fields]
+        self._quoted_user_cols = [f.db_column_quoted for f in self.user_fields]
+        self._quoted_auto_cols = [f.db_column_quoted for f in self.auto_fields]
+        self._concrete_goname_ptrs = [f'&obj.{f.goname}' for f in self.concrete_fields]
 
-    def generate(self, tmpl: jinja2.Template):
-        path = self.gofspath
+        self.select_column_list = ', '.join(self._quoted_concrete_cols)
 
-        receiver = self.goname[:1].lower()
+        groups = (self.core_packages, self.external_packages, self.model_packages)
+        self.imports_block = 'import (\n{})\n'.format('\n\n'.join(
+            ''.join(f'\t"{p}"\n' for p in sorted(group)) for group in groups if group
+        ))
 
-        select_fields = ', '.join(["\"{}\"".format(f.db_column) for f in self.concrete_fields])
-        select_member_ptrs = ', '.join(["&obj.{}".format(f.goname) for f in self.concrete_fields])
-        select_id_stmt = 'SELECT "{}" FROM "{}"'.format(
-            self.pk.db_column,
-            self.db_table,
-        )
+        self._setup_statements()
 
-        insert_fields = [] + self.user_fields
-        if not self.pk.autofield:
-            insert_fields += [self.pk]
+    def _setup_statements(self):
+        """ Build SQL statements and Go argument lists used by the template """
+        receiver = self.receiver = self.goname[:1].lower()
 
-        batch_insert_stmt = 'INSERT INTO "{}" ({}) VALUES'.format(
-            self.db_table,
-            ', '.join(["\"{}\"".format(f.db_column) for f in insert_fields]),
-        )
-        insert_stmt = '{} ({})'.format(
-            batch_insert_stmt,
-            ', '.join(["${}".format(i + 1) for i in range(len(insert_fields))]),
-        )
-        insert_stmt_column_count = len(insert_fields)
-        insert_stmt_values_template = 'fmt.Sprintf("({})", {})'.format(
-            ', '.join(["$%d" for i in range(len(insert_fields))]),
-            ', '.join(['offs + {}'.format(i) for i in range(len(insert_fields))]),
-        )
-        batch_insert_returning = ''
+        self.select_member_ptrs = ', '.join(self._concrete_goname_ptrs)
+        self.select_id_stmt = f'SELECT {self.pk.db_column_quoted} FROM "{self.db_table}"'
+
+        # members of user fields are shared by insert and update arguments
+        user_members = [f'{receiver}.{f.goname}' for f in self.user_fields]
+        pk_member = f'{receiver}.{self.pk.goname}'
+
+        insert_members = [] + user_members
+        insert_cols = [] + self._quoted_user_cols
+        if not self.pk.autofield:
+            insert_members += [pk_member]
+            insert_cols += [self.pk.db_column_quoted]
+
+        self.insert_stmt_column_count = len(insert_members)
+        self.batch_insert_stmt = f'INSERT INTO "{self.db_table}" ({", ".join(insert_cols)}) VALUES'
+        placeholders = ', '.join([f'${i + 1}' for i in range(self.insert_stmt_column_count)])
+        self.insert_stmt = f'{self.batch_insert_stmt} ({placeholders})'
+        self.batch_insert_returning = ''
         if self.auto_fields:
-            batch_insert_returning = 'RETURNING {}'.format(
-                ', '.join(["\"{}\"".format(f.db_column) for f in self.auto_fields]),
-            )
-            insert_stmt += ' ' + batch_insert_returning
-        insert_members = ', '.join(["{}.{}".format(receiver, f.goname) for f in insert_fields])
-        insert_autoptr_members = ', '.join(["&{}.{}".format(receiver, f.goname) for f in self.auto_fields])
-
-        update_stmt = 'UPDATE "{}" SET {} WHERE "{}" = {}'.format(
-            self.db_table,
-            ', '.join(["\"{}\" = ${}".format(self.user_fields[i].db_column, i + 1) for i in range(len(self.user_fields))]),
-            self.pk.db_column,
-            "${}".format(len(self.user_fields) + 1),
+            self.batch_insert_returning = f'RETURNING {", ".join(self._quoted_auto_cols)}'
+            self.insert_stmt += ' ' + self.batch_insert_returning
+        self.insert_members = ', '.join(insert_members)
+        self.insert_autoptr_members = ', '.join([f'&{receiver}.{f.goname}' for f in self.auto_fields])
+
+        set_clause = ', '.join([f'{col} = ${i}' for i, col in enumerate(self._quoted_user_cols, start=1)])
+        self.update_stmt = (
+            f'UPDATE "{self.db_table}" SET {set_clause} '
+            f'WHERE {self.pk.db_column_quoted} = ${len(self.user_fields) + 1}'
         )
-        update_members = ', '.join(["{}.{}".format(receiver, f.goname) for f in self.user_fields + [self.pk]])
+        self.update_members = ', '.join(user_members + [pk_member])
 
-        delete_stmt = 'DELETE FROM "{}" WHERE "{}" = $1'.format(
-            self.db_table,
-            self.pk.db_column,
-        )
+        self.delete_stmt = f'DELETE FROM "{self.db_table}" WHERE {self.pk.db_column_quoted} = $1'
 
-        update_qs_stmt = 'UPDATE "{}" SET '.format(self.db_table)
-        delete_qs_stmt = 'DELETE FROM "{}"'.format(self.db_table)
+        self.update_qs_stmt = f'UPDATE "{self.db_table}" SET '
+        self.delete_qs_stmt = f'DELETE FROM "{self.db_table}"'
 
-        with path.open('w') as fh:
-            fh.write(tmpl.render(
-                model=self,
-                receiver=receiver,
+    def get_app(self, label: str) -> 'Application':
+        return self.app.get_app(label)
 
-                select_fields=select_fields,
-                select_member_ptrs=select_member_ptrs,
-                select_id_stmt=select_id_stmt,
+    def generate(self) -> Optional[Tuple[pathlib.Path, str]]:
+        """ Generate Go source for model
 
-                batch_insert_stmt=batch_insert_stmt,
-                insert_stmt=insert_stmt,
-                insert_stmt_column_count=insert_stmt_column_count,
-                insert_stmt_values_template=insert_stmt_values_template,
-                batch_insert_returning=batch_insert_returning,
-                insert_members=insert_members,
-                insert_autoptr_members=insert_autoptr_members,
+        Returns the path written with the digest of the rendered source, or None if the file was already up to date.
+        The file is written without signature, it is added by Apps.generate() once formatted.
+        """
+        path = self.gofspath
+
+        source = _MODEL_TEMPLATE.render(
+            model=self,
+            receiver=self.receiver,
+
+            select_fields=self.select_column_list,
+            select_member_ptrs=self.select_member_ptrs,
+            select_id_stmt=self.select_id_stmt,
+
+            batch_insert_stmt=self.batch_insert_stmt,
+            insert_stmt=self.insert_stmt,
+            insert_stmt_column_count=self.insert_stmt_column_count,
+            batch_insert_returning=self.batch_insert_returning,
+            insert_members=self.insert_members,
+            insert_autoptr_members=self.insert_autoptr_members,
+
+            update_stmt=self.update_stmt,
+            update_members=self.update_members,
 
-                update_stmt=update_stmt,
-                update_members=update_members,
+            delete_stmt=self.delete_stmt,
 
-                delete_stmt=delete_stmt,
+            update_qs_stmt=self.update_qs_stmt,
 
-                update_qs_stmt=update_qs_stmt,
+            delete_qs_stmt=self.delete_qs_stmt,
+        )
+
+        # the first line carries hashes of the rendered source and of the formatted body,
+        # files with unchanged source and an intact body are left alone
+        data = source.encode('utf-8')
+        source_digest = _digest(data)
+        try:
+            header, newline, body = path.read_bytes().partition(b'\n')
+            if header + newline == _signature_line(source_digest, body):
+                return None
+        except FileNotFoundError:
+            pass
 
-                delete_qs_stmt=delete_qs_stmt,
-            ))
+        path.write_bytes(data)
 
-        subprocess.check_call(["gofmt", "-w", path.as_posix()])
+        return path, source_digest
 
 
 class Application:
@@ -1121,9 +1294,18 @@ class Application:
     def __init__(self, apps: 'Apps', app: AppConfig):
         self.apps = apps
         self.app = app
+        self.label: str = app.label
         self.models: Mapping[str, Model] = dict()
         self.generate = False
 
+        # This two should be in sync
+
+        # Represents go module path
+        self.gomodule: str = posixpath.join(apps.models_import_path, self.label)
+
+        # Represents relative path on filesystem
+        self.gofspath: pathlib.Path = pathlib.Path('models') / self.label
+
         for djmodel in app.get_models():
             # do not process abstract models
             if djmodel._meta.abstract:
@@ -1132,25 +1314,9 @@ class Application:
             model = Model(self, djmodel)
             self.models[model.model_name] = model
 
-    @property
-    def label(self):
-        return self.app.label
-
-    # This two should be in sync
-
-    @property
-    def gomodule(self) -> str:
-        """ Represents go module path """
-        return os.path.join(args.gomodule, 'models', self.label)
-
-    @property
-    def gofspath(self) -> pathlib.Path:
-        """ Represents relative path on filesystem """
-        return pathlib.Path(os.path.join('models', self.label))
-
     def setup(self):
         """ Setup Application """
-        for _, model in self.models.items():
+        for model in self.models.values():
             model.setup()
 
     def get_app(self, label: str) -> 'Application':
@@ -1159,13 +1325,6 @@ class Application:
     def get_model(self, model_name: str) -> Model:
         return self.models[model_name]
 
-    def do_generate(self, tmpl: jinja2.Template):
-        path = self.gofspath
-        path.mkdir(parents=True, exist_ok=True)
-
-        for _, model in self.models.items():
-            model.generate(tmpl)
-
 
 class Apps:
     """ Registry of apps
@@ -1174,41 +1333,136 @@ class Apps:
     https://docs.djangoproject.com/en/3.0/ref/applications/#django.apps.AppConfig.label
     """
 
-    def __init__(self, commandline: str = None):
+    def __init__(self, gomodule: str, commandline: str = None):
+        # Applications are created on first access, see get_app()
         self.apps: Mapping[str, Application] = dict()
         self.commandline = commandline
 
-        for djapp in apps.get_app_configs():
-            app = Application(self, djapp)
-            self.apps[app.label] = app
+        # Go import path of the generated models package
+        self.models_import_path = posixpath.join(gomodule, 'models')
 
-    def generate(self, tmpl: jinja2.Template, apps: List[str]):
+        # Django application configs, indexed by label
+        self._djapps: Mapping[str, AppConfig] = {djapp.label: djapp for djapp in apps.get_app_configs()}
+
+        # Models of applications being generated, collected in _setup()
+        self._models_to_generate: List[Model] = []
+
+    def generate(self, apps: List[str], jobs: int = None):
         # Mark apps to be generated
         for label in apps:
-            app = self.apps[label]
+            app = self.get_app(label)
             app.generate = True
 
         self._setup()
 
         for label in apps:
-            app = self.apps[label]
-            app.do_generate(tmpl)
+            self.apps[label].gofspath.mkdir(parents=True, exist_ok=True)
+
+        written = [result for result in _generate_models(self._models_to_generate, jobs) if result is not None]
+
+        # format all written files with a single gofmt run
+        if written:
+            subprocess.check_call(["gofmt", "-s", "-w"] + [path.as_posix() for path, _ in written])
+
+        # sign files only once formatted, so that files of a failed or interrupted run are regenerated
+        for path, source_digest in written:
+            body = path.read_bytes()
+            _replace_file(path, _signature_line(source_digest, body) + body)
 
     def _setup(self):
-        for _, app in self.apps.items():
-            if app.generate:
-                app.setup()
+        self._models_to_generate = []
+        # setup may create referenced applications, iterate over a snapshot
+        for app in [app for app in self.apps.values() if app.generate]:
+            app.setup()
+            self._models_to_generate += app.models.values()
 
     def get_app(self, label: str) -> Application:
-        return self.apps[label]
+        app = self.apps.get(label)
+        if app is None:
+            app = self.apps[label] = Application(self, self._djapps[label])
+
+        return app
+
+
+# Models being generated, inherited by forked workers
+_generating_models: List[Model] = []
+
+
+def _generate_model(index: int) -> Optional[Tuple[pathlib.Path, str]]:
+    return _generating_models[index].generate()
+
+
+def _usable_cpus() -> int:
+    """ Number of CPUs this process may run on """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def _generate_models(models: List[Model], jobs: int = None) -> List[Optional[Tuple[pathlib.Path, str]]]:
+    """ Generate models, in parallel if possible
+
+    Models reference Django classes and are not picklable, so workers are forked
+    after setup and receive only indices into _generating_models.
+
+    Forking after system libraries have been loaded is unsafe on some platforms,
+    e.g. macOS, so parallel generation is the default only on Linux, elsewhere
+    it has to be requested explicitly.
+    """
+    global _generating_models
+
+    if not jobs:
+        jobs = _usable_cpus() if sys.platform.startswith('linux') else 1
+
+    jobs = min(jobs, len(models))
+    if jobs < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [model.generate() for model in models]
+
+    _generating_models = models
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('fork')) as executor:
+            # hand out a few batches per worker to keep IPC round trips low
+            chunksize = max(1, len(models) // (jobs * 4))
+            return list(executor.map(_generate_model, range(len(models)), chunksize=chunksize))
+    finally:
+        _generating_models = []
+
+
+def _without_jobs(argv: List[str]) -> List[str]:
+    """ Command line arguments without --jobs/-j, which does not affect generated code """
+    result: List[str] = []
+    skip_value = False
+    for i, arg in enumerate(argv):
+        if skip_value:
+            skip_value = False
+            continue
+
+        # everything after -- is positional
+        if arg == '--':
+            result += argv[i:]
+            break
+
+        # --jobs N, --jobs=N and unambiguous abbreviations like --jo N
+        name = arg.split('=', 1)[0]
+        if len(name) > 2 and '--jobs'.startswith(name):
+            skip_value = '=' not in arg
+            continue
+
+        # -j N and -jN
+        if arg.startswith('-j'):
+            skip_value = arg == '-j'
+            continue
+
+        result.append(arg)
+
+    return result
 
 
 if __name__ == '__main__':
-    import sys
-    import os
     sys.path.insert(0, os.getcwd())
 
-    commandline = 'DJANGO_SETTINGS_MODULE={} {}'.format(os.getenv('DJANGO_SETTINGS_MODULE'), ' '.join(sys.argv))
+    commandline = 'DJANGO_SETTINGS_MODULE={} {}'.format(os.getenv('DJANGO_SETTINGS_MODULE'), ' '.join(_without_jobs(sys.argv)))
 
     import django
     django.setup()
@@ -1216,16 +1470,15 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("applications", nargs='+', type=str, help="Applications whose models to be generated")
     parser.add_argument("--gomodule", type=str, required=False, help="Final Go module path")
+    parser.add_argument("--jobs", "-j", type=int, required=False, help="Number of parallel workers, defaults to usable CPU count on Linux, 1 elsewhere")
 
     args = parser.parse_args()
 
-    jenv = jinja2.Environment()
-    jenv.filters['string'] = lambda x: "\"{}\"".format(x)
-    tmpl = jenv.from_string(_model_template)
-
-    apps = Apps(commandline=commandline)
-    apps.generate(tmpl, args.applications)
+    apps = Apps(args.gomodule, commandline=commandline)
+    apps.generate(args.applications, jobs=args.jobs)
 
-    # copy interface.go
+    # copy interface.go, unless already up to date
     spath = pathlib.Path(__file__).parent / 'static' / 'interface.go'
-    shutil.copy(spath.as_posix(), 'models')
+    dpath = pathlib.Path('models') / spath.name
+    if not (dpath.exists() and filecmp.cmp(spath, dpath, shallow=False)):
+        shutil.copy(spath.as_posix(), dpath.as_posix())
@@ -84,7 +84,7 @@ type AndFragment []ConditionFragment
 
 // GetConditionFragment returns fragment with its parameter
 func (a AndFragment) GetConditionFragment(c *PositionalCounter) (string, []interface{}) {
-	var conds []string
+	conds := make([]string, 0, len(a))
 	var condp []interface{}
 
 	for _, cond := range a {
@@ -102,13 +102,13 @@ type OrFragment []ConditionFragment
 
 // GetConditionFragment returns fragment with its parameter
 func (o OrFragment) GetConditionFragment(c *PositionalCounter) (string, []interface{}) {
-	var conds []string
-	var condp []interface{}
-
 	if len(o) == 0 {
 		return "false", nil
 	}
 
+	conds := make([]string, 0, len(o))
+	var condp []interface{}
+
 	for _, cond := range o {
 		s, p := cond.GetConditionFragment(c)
 